@@ -2,40 +2,246 @@
 import subprocess
 import shutil
 import os
+import stat
 import sys
-import glob
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
+# Executable suffix for binaries built on this host
+EXE_EXT = ".exe" if os.name == "nt" else ""
+
+# (binary, package) pairs built by build_cli
+BINARIES = (("shurikenctl", "ninja-cli"),)
+# Binary names clean() removes from target/release
+CLEAN_BIN_NAMES = ("shurikenctl", "ninja-cli")
+
 
 # ===== Pretty printing =====
+STATUS_COLORS = {
+    "Info": "\033[1;32m",
+    "Run": "\033[1;34m",
+    "Warn": "\033[1;33m",
+    "Err": "\033[1;31m",
+    "Rm": "\033[1;33m",
+}
+ARROW = "->" if os.name == "nt" else "→"
+STDOUT_IS_TTY = sys.stdout.isatty()
+# Held for every write to stdout, since builds can run on several threads
+OUTPUT_LOCK = threading.Lock()
+
+
+def format_status(status: str, msg: str) -> str:
+    """One status line, newline included. Colour only goes to a terminal."""
+    if ARROW != "→" and "→" in msg:
+        msg = msg.replace("→", ARROW)
+    if not STDOUT_IS_TTY:
+        return f"{status:>12} {msg}\n"
+    color = STATUS_COLORS.get(status, "\033[1;37m")
+    return f"{color}{status:>12}\033[0m {msg}\n"
+
+
 def print_status(status: str, msg: str):
-    colors = {
-        "Info": "\033[1;32m",
-        "Run": "\033[1;34m",
-        "Warn": "\033[1;33m",
-        "Err": "\033[1;31m",
-        "Rm": "\033[1;33m",
-    }
-    reset = "\033[0m"
-    color = colors.get(status, "\033[1;37m")
-    arrow = "->" if os.name == "nt" else "→"
-    msg = msg.replace("→", arrow)
+    # One write per line; only flush eagerly when someone is watching
+    with OUTPUT_LOCK:
+        sys.stdout.write(format_status(status, msg))
+        if STDOUT_IS_TTY:
+            sys.stdout.flush()
+
 
-    print(f"{color}{status:>12}{reset} {msg}")
+def print_status_lines(lines: list[str]):
+    """Write lines from format_status in a single write."""
+    with OUTPUT_LOCK:
+        sys.stdout.write("".join(lines))
+        if STDOUT_IS_TTY:
+            sys.stdout.flush()
 
 
 # ===== Utilities =====
+# Environment for child processes: cargo's progress bar redraws are pure terminal
+# overhead, and on a terminal colour is forced on so it survives tagged output
+# being piped through us. User settings win.
+CHILD_ENV = {
+    "CARGO_TERM_PROGRESS_WHEN": "never",
+    "CARGO_TERM_COLOR": "always" if STDOUT_IS_TTY else "never",
+    **os.environ,
+}
+# Extra subprocess options for when posix_spawn isn't available. Build tools need
+# neither signal dispositions reset nor inherited fds closed, so skip both on
+# POSIX (posix_spawn does neither to begin with). close_fds means something else
+# on Windows, so leave the defaults there.
+SUBPROCESS_KW = {} if os.name == "nt" else {"close_fds": False, "restore_signals": False}
+
+
+@lru_cache(maxsize=None)
+def which(name: str) -> str | None:
+    """
+    Memoised shutil.which, so PATH (and PATHEXT on Windows) is scanned once per tool.
+    Call which.cache_clear() after installing something.
+    """
+    return shutil.which(name)
+
+
+@lru_cache(maxsize=1)
 def find_cargo() -> str:
     """Find absolute path to cargo executable."""
-    cargo_path = shutil.which("cargo")
+    cargo_path = which("cargo")
     if not cargo_path:
         sys.exit("Error: Cargo not found. Make sure Rust is installed and in PATH.")
     return os.path.abspath(cargo_path)
 
 
-def run(cmd: list[str], desc: str):
+def spawn(cmd: list[str], tag: str | None = None) -> int:
+    """
+    Run cmd to completion and return its exit code.
+    Uses posix_spawn where available, which skips fork()'s address-space copy.
+    With a tag, the child's stdout and stderr are piped back and every line is
+    prefixed with [tag], so builds running side by side stay readable.
+    """
+    # Children write straight to the fd, so get our own buffered lines out first
+    with OUTPUT_LOCK:
+        sys.stdout.flush()
+    if tag is None:
+        if not hasattr(os, "posix_spawnp"):
+            return subprocess.call(cmd, env=CHILD_ENV, **SUBPROCESS_KW)
+        pid = os.posix_spawnp(cmd[0], cmd, CHILD_ENV)
+        _, status = os.waitpid(pid, 0)
+        return os.waitstatus_to_exitcode(status)
+
+    r, w = os.pipe()
+    with os.fdopen(r, "rb") as reader:
+        try:
+            if hasattr(os, "posix_spawnp"):
+                proc = None
+                pid = os.posix_spawnp(
+                    cmd[0],
+                    cmd,
+                    CHILD_ENV,
+                    file_actions=[
+                        (os.POSIX_SPAWN_DUP2, w, 1),
+                        (os.POSIX_SPAWN_DUP2, w, 2),
+                    ],
+                )
+            else:
+                proc = subprocess.Popen(
+                    cmd, stdout=w, stderr=w, env=CHILD_ENV, **SUBPROCESS_KW
+                )
+        finally:
+            os.close(w)
+
+        for line in reader:
+            text = line.decode("utf-8", errors="replace").rstrip("\r\n")
+            with OUTPUT_LOCK:
+                sys.stdout.write(f"[{tag}] {text}\n")
+                if STDOUT_IS_TTY:
+                    sys.stdout.flush()
+
+    if proc is not None:
+        return proc.wait()
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
+def capture(cmd: list[str]) -> str:
+    """Run cmd and return its stdout, raising CalledProcessError on failure. Stderr is discarded."""
+    if not hasattr(os, "posix_spawnp"):
+        return subprocess.check_output(
+            cmd, text=True, stderr=subprocess.DEVNULL, **SUBPROCESS_KW
+        )
+
+    r, w = os.pipe()
+    with os.fdopen(r, encoding="utf-8") as reader:
+        try:
+            pid = os.posix_spawnp(
+                cmd[0],
+                cmd,
+                os.environ,
+                file_actions=[
+                    (os.POSIX_SPAWN_DUP2, w, 1),
+                    (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+                ],
+            )
+        finally:
+            os.close(w)
+        out = reader.read()
+
+    _, status = os.waitpid(pid, 0)
+    code = os.waitstatus_to_exitcode(status)
+    if code != 0:
+        raise subprocess.CalledProcessError(code, cmd, out)
+    return out
+
+
+def sendfile_copy(src: Path, dst: Path):
+    """
+    Copy src to dst with os.sendfile, keeping the mode bits but not timestamps.
+    sendfile only takes regular files on Linux; elsewhere this is shutil.copy.
+    """
+    if not sys.platform.startswith("linux"):
+        shutil.copy(src, dst)
+        return
+
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        size = os.fstat(s.fileno()).st_size
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(d.fileno(), s.fileno(), offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+    shutil.copymode(src, dst)
+
+
+def up_to_date(src: Path, dst: Path) -> bool:
+    """Whether dst already matches src: the same file, or the same size and no older."""
+    try:
+        src_st, dst_st = src.stat(), dst.stat()
+    except FileNotFoundError:
+        return False
+    return os.path.samestat(src_st, dst_st) or (
+        src_st.st_size == dst_st.st_size and dst_st.st_mtime_ns >= src_st.st_mtime_ns
+    )
+
+
+def link_or_copy(src: str | Path, dst: str | Path):
+    """
+    Hardlink src to dst, falling back to a copy across filesystems.
+    Also fits shutil.copytree's copy_function.
+    """
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        sendfile_copy(src, dst)
+
+
+def remove_tree(path: str | Path):
+    """
+    Delete a cargo output directory bottom-up, ignoring errors like rmtree(ignore_errors=True).
+    Skips rmtree's symlink-race protection, which buys nothing for our own build output.
+    """
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        remove_tree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+                except OSError:
+                    pass
+        os.rmdir(path)
+    except OSError:
+        pass
+
+
+def run(cmd: list[str], desc: str, tag: str | None = None):
     print_status("Run", " ".join(cmd))
-    if subprocess.call(cmd) != 0:
+    if spawn(cmd, tag) != 0:
         sys.exit(f"{desc} failed")
 
 # ===== Build logic =====
@@ -49,25 +255,72 @@ def target_dir(target: str | None, warn_missing: bool = True) -> Path:
     return tdir
 
 
+@lru_cache(maxsize=1)
 def detect_target() -> str:
+    """
+    Triple for builds without --target. CARGO_BUILD_TARGET wins if set, since cargo
+    builds for it too; otherwise ask rustc for the host. Cached per process.
+    """
+    env_target = os.environ.get("CARGO_BUILD_TARGET")
+    if env_target:
+        return env_target
+
     try:
-        out = subprocess.check_output(["rustc", "-vV"], text=True)
-        return next(
-            l.split(":")[1].strip() for l in out.splitlines() if l.startswith("host:")
-        )
+        out = capture(["rustc", "-vV"])
     except Exception:
         sys.exit("Failed to detect target triple")
 
+    _, found, rest = out.partition("\nhost:")
+    if not found:
+        sys.exit("Failed to detect target triple")
+    return rest.partition("\n")[0].strip()
+
 
 def extract_target(args: list[str]) -> str | None:
-    if "--target" in args:
-        i = args.index("--target")
-        return args[i + 1] if i + 1 < len(args) else None
+    """Return the value of --target (either `--target x` or `--target=x`), if given."""
+    for i, arg in enumerate(args):
+        if arg == "--target":
+            return args[i + 1] if i + 1 < len(args) else None
+        if arg.startswith("--target="):
+            return arg[len("--target="):]
     return None
 
 
 # ===== Helper: Find and relocate binary =====
-# ===== Helper: Find and relocate binary =====
+def release_dirs(target_root: Path) -> list[Path]:
+    """
+    List target/release and every target/<triple>/release that exists.
+    Only looks one level deep instead of walking deps/, incremental/ and the rest.
+    """
+    dirs = [target_root / "release"]
+    try:
+        with os.scandir(target_root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(Path(entry.path) / "release")
+    except FileNotFoundError:
+        return []
+    return [d for d in dirs if d.is_dir()]
+
+
+def newest_release_binary(target_root: Path, names: tuple[str, ...]) -> Path | None:
+    """
+    Newest file called one of `names` across release_dirs(target_root).
+    One stat per candidate path, tracking the newest as it goes.
+    """
+    newest, newest_mtime = None, -1
+    for release in release_dirs(target_root):
+        for name in names:
+            path = release / name
+            try:
+                st = path.stat()
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            if stat.S_ISREG(st.st_mode) and st.st_mtime_ns > newest_mtime:
+                newest, newest_mtime = path, st.st_mtime_ns
+    return newest
+
+
 def find_and_place_binary(extra_args=None):
     """
     Find any shurikenctl[.exe] in target/**/release and copy it to GUI/src-tauri/binaries.
@@ -77,39 +330,25 @@ def find_and_place_binary(extra_args=None):
     binaries_dir = (root / "GUI" / "src-tauri" / "binaries").resolve()
     binaries_dir.mkdir(parents=True, exist_ok=True)
 
-    patterns = [
-        "target/**/release/shurikenctl",
-        "target/**/release/shurikenctl.exe",
-    ]
-    found_files = []
-    for pattern in patterns:
-        found_files.extend(glob.glob(str(root / pattern), recursive=True))
-
-    if not found_files:
+    names = ("shurikenctl", "shurikenctl.exe")
+
+    # With an explicit --target the binary's location is known, so try that first
+    explicit = extract_target(extra_args or [])
+    latest = None
+    if explicit:
+        exact = root / "target" / explicit / "release"
+        latest = next((exact / n for n in names if (exact / n).is_file()), None)
+    if latest is None:
+        latest = newest_release_binary(root / "target", names)
+    if latest is None:
         print_status("Err", "No shurikenctl binary found in any release folder.")
         return
 
-    found_files.sort(key=lambda f: os.path.getmtime(f), reverse=True)
-    latest = Path(found_files[0])
-
     # Determine target triple
-    triple = None
-    if extra_args:
-        if "--target" in extra_args:
-            i = extra_args.index("--target")
-            if i + 1 < len(extra_args):
-                triple = extra_args[i + 1]
+    triple = explicit
     if not triple:
         # Fallback to rustc detection
-        try:
-            out = subprocess.check_output(["rustc", "-vV"], text=True)
-            triple = next(
-                l.split(":")[1].strip()
-                for l in out.splitlines()
-                if l.startswith("host:")
-            )
-        except Exception:
-            sys.exit("Failed to detect target triple")
+        triple = detect_target()
 
     # Rename binary with target triple
     dest_name = f"{latest.stem}-{triple}{latest.suffix}"
@@ -158,42 +397,45 @@ def build_ffi(args):
     include_dir.mkdir(exist_ok=True)
 
     dest = sdk_dir / out_name
+    if up_to_date(src, dest):
+        print_status("Info", f"{dest} is up to date")
+        return
     shutil.copy(src, dest)
     print_status("Info", f"Copied {src_name} → {dest}")
 
 
-def build_cli(args):
+def build_cli(args, tagged=False):
     cargo = find_cargo()
     target = extract_target(args) or detect_target()
     print_status("Info", f"Target: {target}")
 
     release = target_dir(target, warn_missing=False)
     host_release = target_dir(None, warn_missing=False)
-    bins = [("shurikenctl", "ninja-cli")]
-    ext = ".exe" if os.name == "nt" else ""
-
-    for bin_name, pkg in bins:
-        print_status("Info", f"Building {pkg}")
-        run(
-            [cargo, "build", "--bin", bin_name, "--package", pkg, "--release"] + args,
-            "Build",
-        )
 
+    # One cargo run for every binary: cargo starts up once and schedules all crates together
+    pkgs = ", ".join(pkg for _, pkg in BINARIES)
+    selection = []
+    for bin_name, pkg in BINARIES:
+        selection += ["--bin", bin_name, "--package", pkg]
+
+    print_status("Info", f"Building {pkgs}")
+    run(
+        [cargo, "build"] + selection + ["--release"] + args,
+        "Build",
+        tag=pkgs if tagged else None,
+    )
+
+    for bin_name, pkg in BINARIES:
         built_candidates = [
-            release / f"{bin_name}{ext}",
-            Path("target") / target / "release" / f"{bin_name}{ext}",
-            host_release / f"{bin_name}{ext}",
+            release / f"{bin_name}{EXE_EXT}",
+            Path("target") / target / "release" / f"{bin_name}{EXE_EXT}",
+            host_release / f"{bin_name}{EXE_EXT}",
         ]
         built = next((p for p in built_candidates if p.exists()), None)
         if built is None:
             root = Path(__file__).resolve().parent.parent
-            discovered = sorted(
-                root.glob(f"target/**/release/{bin_name}{ext}"),
-                key=lambda p: p.stat().st_mtime,
-                reverse=True,
-            )
-            if discovered:
-                built = discovered[0]
+            built = newest_release_binary(root / "target", (f"{bin_name}{EXE_EXT}",))
+            if built is not None:
                 print_status("Info", f"Discovered built binary at {built}")
             else:
                 print_status("Warn", "Built binary not found in expected target paths; scanning target/**/release...")
@@ -201,112 +443,186 @@ def build_cli(args):
                 return
 
         host_release.mkdir(parents=True, exist_ok=True)
-        dest = host_release / f"{bin_name}{ext}"
-        shutil.move(built, dest)
+        dest = host_release / f"{bin_name}{EXE_EXT}"
+        try:
+            os.replace(built, dest)
+        except OSError:
+            shutil.move(built, dest)
         print_status("Info", f"Moved {built.name} → {dest.name}")
 
-        renamed = host_release / f"{bin_name}-{target}{ext}"
+        renamed = host_release / f"{bin_name}-{target}{EXE_EXT}"
         dest.rename(renamed)
         print_status("Info", f"Renamed to {renamed.name}")
 
         copy_dir = Path("GUI/src-tauri")
         copy_dir.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(renamed, copy_dir / renamed.name)
-        print_status("Info", "Copied to GUI")
+        if up_to_date(renamed, copy_dir / renamed.name):
+            print_status("Info", "GUI copy is up to date")
+        else:
+            link_or_copy(renamed, copy_dir / renamed.name)
+            print_status("Info", "Copied to GUI")
 
     if release.exists() and release != host_release:
-        shutil.rmtree(release, ignore_errors=True)
+        remove_tree(release)
         print_status("Rm", f"Cleaned {release}")
 
+# Tools the GUI build needs up front, with the command that installs each one
+GUI_TOOLS = {
+    "pnpm": ["npm", "install", "-g", "pnpm"],
+}
+
+
 def run_ps(command: str):
-    shell = shutil.which("pwsh") or "powershell"
+    shell = which("pwsh") or "powershell"
+    sys.stdout.flush()
     return subprocess.call([
         shell,
         "-NoProfile",
         "-ExecutionPolicy", "Bypass",
         "-Command",
         command
-    ])
+    ], env=CHILD_ENV, **SUBPROCESS_KW)
+
+def build_frontend(tagged=False):
+    """
+    Build the Next.js frontend on its own, so it can run alongside the CLI build.
+    Doesn't depend on the shurikenctl sidecar, only the tauri bundling step does.
+    """
+    ensure_tools(GUI_TOOLS)
+    print_status("Info", "Building GUI frontend")
+    run(
+        [which("pnpm"), "--dir", "GUI", "build"],
+        "Frontend build",
+        tag="frontend" if tagged else None,
+    )
+
+
+def tauri_cli() -> tuple[list[str], list[str]]:
+    """
+    Pick how to run the tauri CLI by probing what's installed, rather than
+    finding out through a failed build. Prefers pnpm, then cargo tauri, then npx.
+    Returns the command prefix and what goes before the passthrough args.
+    """
+    if which("pnpm"):
+        return ["pnpm", "dlx", "@tauri-apps/cli"], []
+    # cargo runs subcommands from cargo-<name> binaries on PATH, so no need to spawn it
+    if which("cargo-tauri"):
+        return ["cargo", "tauri"], ["--"]
+    if which("npx"):
+        return ["npx", "--yes", "@tauri-apps/cli"], []
 
-def build_gui(args):
+    ensure_tools(GUI_TOOLS)
+    return ["pnpm", "dlx", "@tauri-apps/cli"], []
+
+
+def build_gui(args, prebuilt_frontend=False):
     import platform
 
+    # Tell tauri to skip beforeBuildCommand when the frontend is already built
+    config = []
+    if prebuilt_frontend:
+        config = ["--config", str(Path(__file__).resolve().parent / "tauri.prebuilt.json")]
+
     print_status("Info", "Building GUI")
+    cli, separator = tauri_cli()
     if platform.system() == "Windows":
-        # On windows use powershell + pnpm, as cargo tauri is very slow on windows for some reason
-        ensure_tool("pnpm", ["npm", "install", "-g", "pnpm"])
-        tauri_cmd = "pnpm dlx @tauri-apps/cli build " + " ".join(args)
+        # On windows go through powershell, as cargo tauri is very slow on windows for some reason
+        tauri_cmd = " ".join(
+            cli + ["build"] + [f"'{a}'" for a in config] + separator + args
+        )
+        print_status("Run", tauri_cmd)
         if run_ps(tauri_cmd) != 0:
-            print_status("Warn", "pnpm failed, trying cargo tauri as fallback")
-            ensure_tool("cargo", ["cargo", "install", "tauri-cli"])
-            cargo = find_cargo()
-            fallback_cmd = f'cargo tauri build -- ' + " ".join(args)
-            run_ps(fallback_cmd)
+            sys.exit("GUI build failed")
     else:
-        # On Linux/macOS, use pnpm for speed
-        ensure_tool("pnpm", ["npm", "install", "-g", "pnpm"])
-        cmd = ["pnpm", "dlx", "@tauri-apps/cli", "build"] + args
-        if subprocess.call(cmd) != 0:
-            print_status("Warn", "pnpm failed, trying cargo tauri as fallback")
-            ensure_tool("cargo", ["cargo", "install", "tauri-cli"])
-            cargo = find_cargo()
-            run([cargo, "tauri", "build", "--"] + args, "GUI build")
+        run(cli + ["build"] + config + separator + args, "GUI build")
 
 
-
-def ensure_tool(name, install_cmd=None):
-    if shutil.which(name):
+def ensure_tools(tools: dict[str, list[str] | None]):
+    """
+    Make sure every tool in `tools` is on PATH, running its install command if not.
+    Missing tools that install through `npm install -g` share a single npm run.
+    """
+    npm_pkgs = []
+    for name, install_cmd in tools.items():
+        if which(name):
+            continue
+        print_status("Warn", f"{name} not found")
+        if not install_cmd:
+            sys.exit(f"{name} is required")
+        if install_cmd[:3] == ["npm", "install", "-g"]:
+            npm_pkgs.extend(install_cmd[3:])
+        else:
+            run(install_cmd, f"Install {name}")
+            which.cache_clear()
+
+    if npm_pkgs:
+        run(["npm", "install", "-g"] + npm_pkgs, f"Install {', '.join(npm_pkgs)}")
+        which.cache_clear()
+
+
+def remove_file(path: Path, label: str = ""):
+    """Unlink path if it exists and report it. No separate exists() check."""
+    try:
+        path.unlink()
+    except FileNotFoundError:
         return
-    print_status("Warn", f"{name} not found")
-    if install_cmd:
-        run(install_cmd, f"Install {name}")
-    else:
-        sys.exit(f"{name} is required")
+    print_status("Rm", f"{label}{path}")
 
 
 def clean():
     host_target = detect_target()
     host_release = target_dir(None)
-    ext = ".exe" if os.name == "nt" else ""
-    bins = ["shurikenctl", "ninja-cli"]
 
-    for b in bins:
-        for p in [host_release / f"{b}{ext}", host_release / f"{b}-{host_target}{ext}"]:
-            if p.exists():
-                p.unlink()
-                print_status("Rm", str(p))
+    doomed = [
+        (p, "")
+        for b in CLEAN_BIN_NAMES
+        for p in (host_release / f"{b}{EXE_EXT}", host_release / f"{b}-{host_target}{EXE_EXT}")
+    ]
 
+    # is_file() comes from the cached dirent type, no stat per entry
     gui_dir = Path("GUI/src-tauri/binaries")
-    for p in gui_dir.glob("*"):
-        if p.is_file():
-            p.unlink()
-            print_status("Rm", f"GUI binary {p}")
+    try:
+        with os.scandir(gui_dir) as entries:
+            doomed.extend(
+                (gui_dir / e.name, "GUI binary ")
+                for e in entries
+                if e.is_file(follow_symlinks=False)
+            )
+    except FileNotFoundError:
+        pass
+
+    # Unlinks are independent, so let them overlap (helps on slow or network disks)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda job: remove_file(*job), doomed))
 
 def export_dist():
     """
     Create a top-level dist/ folder and copy final Tauri bundle
     artifacts + shurikenctl Linux binary into it.
+    Bundles are write-once, so they're hardlinked where the filesystem allows.
     """
     root = Path(__file__).resolve().parent.parent
     dist_dir = root / "dist"
 
-    # Clean dist/
+    # Clean dist/: move the old one aside and delete it while the new one fills up
+    cleanup = None
     if dist_dir.exists():
-        shutil.rmtree(dist_dir)
+        trash = dist_dir.with_name("dist.old")
+        remove_tree(trash)  # leftover from an interrupted run
+        os.rename(dist_dir, trash)
+        cleanup = threading.Thread(target=remove_tree, args=(trash,))
+        cleanup.start()
     dist_dir.mkdir()
 
     # -----------------------
     # 1. Collect Tauri bundles
     # -----------------------
-    bundle_roots = [
-        root / "target" / "release" / "bundle",
-        root / "target" / "debug" / "bundle",
-        root / "GUI" / "src-tauri" / "target" / "release" / "bundle",
-        root / "GUI" / "src-tauri" / "target" / "debug" / "bundle",
-    ]
-    bundle_roots.extend(root.glob("target/**/release/bundle"))
-    bundle_roots.extend((root / "GUI" / "src-tauri").glob("target/**/release/bundle"))
-    existing_bundle_roots = [p for p in bundle_roots if p.exists()]
+    # target/debug/bundle plus target/[<triple>/]release/bundle, for both target dirs
+    bundle_roots = []
+    for target_root in (root / "target", root / "GUI" / "src-tauri" / "target"):
+        bundle_roots.append(target_root / "debug" / "bundle")
+        bundle_roots.extend(release / "bundle" for release in release_dirs(target_root))
+    existing_bundle_roots = [p for p in bundle_roots if p.is_dir()]
 
     if not existing_bundle_roots:
         print_status("Warn", "Tauri bundle directory not found; exporting CLI binaries only")
@@ -330,26 +646,40 @@ def export_dist():
         "control.tar.gz",
     }
 
-    for bundle_root in existing_bundle_roots:
-        for path in bundle_root.rglob("*"):
-            # Skip directories unless it's a macOS .app bundle
-            if path.is_dir() and path.suffix != ".app" and path.name not in blacklist:
-                continue
+    # Per-file status lines, written in one go once copying is done
+    copied = []
+
+    # Tauri writes each format's artifacts straight into bundle/<format>/; anything
+    # deeper is staging (deb data/, AppImage AppDir, ...) and never shipped
+    bundle_formats = ("msi", "nsis", "dmg", "macos", "deb", "rpm", "appimage")
 
-            # Allow .app bundles
-            if path.is_dir() and path.suffix == ".app":
-                dest = dist_dir / path.name
-                if dest.exists():
-                    shutil.rmtree(dest)
-                shutil.copytree(path, dest)
-                print_status("Info", f"Copied {path} → dist/{path.name}")
+    for bundle_root in existing_bundle_roots:
+        for fmt in bundle_formats:
+            try:
+                entries = list(os.scandir(bundle_root / fmt))
+            except FileNotFoundError:
                 continue
 
-            # Allow files by extension
-            if path.is_file() and path.suffix in allowed_exts:
-                dest = dist_dir / path.name
-                shutil.copy2(path, dest)
-                print_status("Info", f"Copied {path} → dist/{path.name}")
+            for entry in entries:
+                path = Path(entry.path)
+                dest = dist_dir / entry.name
+
+                # Allow macOS .app bundles, copied whole
+                if entry.is_dir() and entry.name.endswith(".app"):
+                    if dest.exists():
+                        shutil.rmtree(dest)
+                    shutil.copytree(path, dest, copy_function=link_or_copy)
+                    copied.append(format_status("Info", f"Copied {path} → dist/{entry.name}"))
+                    continue
+
+                # Allow files by extension
+                if (
+                    entry.is_file()
+                    and entry.name not in blacklist
+                    and os.path.splitext(entry.name)[1] in allowed_exts
+                ):
+                    link_or_copy(path, dest)
+                    copied.append(format_status("Info", f"Copied {path} → dist/{entry.name}"))
 
     # ----------------------------------------
     # 2. Add shurikenctl Linux binary only
@@ -364,13 +694,19 @@ def export_dist():
     for binary in shuriken_candidates:
         if binary.is_file():
             dest = dist_dir / binary.name
-            shutil.copy2(binary, dest)
+            link_or_copy(binary, dest)
             copied_cli += 1
-            print_status("Info", f"Included {binary.name} → dist/{binary.name}")
+            copied.append(
+                format_status("Info", f"Included {binary.name} → dist/{binary.name}")
+            )
+
+    print_status_lines(copied)
 
     if copied_cli == 0:
         print_status("Warn", "No shurikenctl binary found to include in dist")
 
+    if cleanup is not None:
+        cleanup.join()
     print_status("Info", "Dist export completed.")
 
 def install():
@@ -395,6 +731,46 @@ def install():
 
     print_status("Info", f"Installed {src.name} → {dest}")
 
+# ===== Entrypoint actions =====
+def build_cli_dist(args):
+    build_cli(args)
+    export_dist()
+
+
+def build_gui_dist(args):
+    build_gui(args)
+    export_dist()
+
+
+def build_all(args):
+    """
+    Default: build the cli and gui.
+    The frontend has no dependency on the CLI, so both build at the same time.
+    Only the tauri bundling step needs the shurikenctl sidecar.
+    """
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        jobs = [
+            pool.submit(build_cli, args, tagged=True),
+            pool.submit(build_frontend, tagged=True),
+        ]
+        for job in as_completed(jobs):
+            job.result()
+
+    build_gui(args, prebuilt_frontend=True)
+    export_dist()
+
+
+# argparse dest -> action taking the passthrough args, in precedence order
+ACTIONS = {
+    "clean": lambda args: clean(),
+    "install": lambda args: install(),
+    "libs_only": build_lib,
+    "cli_only": build_cli_dist,
+    "ffi_only": build_ffi,
+    "gui_only": build_gui_dist,
+}
+
+
 # ===== CLI Entrypoint =====
 def main():
     import argparse
@@ -424,37 +800,11 @@ def main():
     )
 
     args, passthrough = parser.parse_known_args()
-    if args.clean:
-        clean()
-        return
-
-    if args.install:
-        install()
-        return
 
     # please place args manually lol
-    if args.libs_only:
-        build_lib(args=passthrough)
-        return
-
-    if args.cli_only:
-        build_cli(args=passthrough)
-        export_dist()
-        return
-    
-    if args.ffi_only:
-        build_ffi(args=passthrough)
-        return
-
-    if args.gui_only:
-        build_gui(args=passthrough)
-        export_dist()
-        return
-
-    # Default: build the cli and gui. 
-    build_cli(args=passthrough)
-    build_gui(args=passthrough)
-    export_dist()
+    # First flag set wins, in ACTIONS order; no flag means the full build.
+    action = next((fn for flag, fn in ACTIONS.items() if getattr(args, flag)), build_all)
+    action(passthrough)
 
 
 if __name__ == "__main__":
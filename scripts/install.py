@@ -134,7 +134,8 @@ StartupNotify=true
     
     # Update desktop database
     try:
-        subprocess.run(["update-desktop-database", desktop_dir], check=False)
+        # Nothing to isolate from, so skip the fd close loop
+        subprocess.run(["update-desktop-database", desktop_dir], check=False, close_fds=False)
         print("✓ Desktop database updated")
     except FileNotFoundError:
         print("  (update-desktop-database not found, skipping)")
@@ -3,45 +3,104 @@ import re
 import json
 import os
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 
 ARTIFACTS_DIR = Path("artifacts")
+VERSION_CACHE = Path(".version-cache.json")
+
+# `package.version` under [workspace], or `version` under [workspace.package]
+WORKSPACE_VERSION_RE = re.compile(
+    rb'^\[workspace(?P<pkg>\.package)?\][ \t]*\r?$'
+    rb'(?:(?!^\[).)*?'
+    rb'^[ \t]*(?(pkg)|package\.)version[ \t]*=[ \t]*"(?P<version>[^"]+)"',
+    re.MULTILINE | re.DOTALL,
+)
+
+# Level-2 changelog heading, e.g. "## 1.2.0" or "## [1.2.0] - 2024-01-01"
+SECTION_RE = re.compile(r"^##(?!#)[ \t]*\[?([^\]\s]*)\]?[^\n]*$", re.MULTILINE)
 
 
 def get_version() -> str:
     with open("Cargo.toml", "rb") as f:
-        config = tomllib.load(f)
+        data = f.read()
+
+    # Only one key is needed, so skip building the whole TOML tree when the regex finds it
+    match = WORKSPACE_VERSION_RE.search(data)
+    if match:
+        return match.group("version").decode("utf-8")
+
+    config = tomllib.loads(data.decode("utf-8"))
     return config["workspace"]["package"]["version"]
 
 
+@lru_cache(maxsize=None)
+def signature_index(search_root: Path) -> dict[str, Path]:
+    """Walk search_root once and map every *.sig file name to its path."""
+    index = {}
+    for dirpath, _, filenames in os.walk(search_root):
+        for name in filenames:
+            if name.endswith(".sig"):
+                index.setdefault(name, Path(dirpath) / name)
+    return index
+
+
 def read_sig_for_asset(asset_name: str, search_root: Path) -> str:
     """
     Look up **/{asset_name}.sig starting from search_root.
     Fails if not found (updater MUST have a signature).
     """
     sig_name = f"{asset_name}.sig"
-    matches = list(search_root.glob(f"**/{sig_name}"))
 
-    if not matches:
-        raise FileNotFoundError(f"Signature not found: {sig_name}")
+    # Just try the read; a separate existence check would only add a stat
+    try:
+        return signature_index(search_root)[sig_name].read_text(encoding="utf-8").strip()
+    except (KeyError, FileNotFoundError):
+        raise FileNotFoundError(f"Signature not found: {sig_name}") from None
 
-    return matches[0].read_text(encoding="utf-8").strip()
 
-
-def get_changelog_for_version(version: str, changelog_file="CHANGELOG.md") -> str:
+@lru_cache(maxsize=None)
+def changelog_sections(changelog_file="CHANGELOG.md") -> dict[str, str]:
+    """
+    Split the changelog once into {version: notes}.
+    A section runs from its "## <version>" heading to the next level-2 heading.
+    """
     with open(changelog_file, "r", encoding="utf-8") as f:
         content = f.read()
 
-    pattern = rf"""
-        \#\#\s*\[?{re.escape(version)}\]?
-        (?:\s*-\s*\d{{4}}-\d{{2}}-\d{{2}})?
-        \s*\n
-        (.*?)
-        (?=\n\#\#\s|\Z)
+    headings = list(SECTION_RE.finditer(content))
+    sections = {}
+    for heading, following in zip(headings, headings[1:] + [None]):
+        end = following.start() if following else len(content)
+        # First heading wins if a version shows up twice
+        sections.setdefault(heading.group(1), content[heading.end():end].strip())
+    return sections
+
+
+def get_changelog_for_version(version: str, changelog_file="CHANGELOG.md") -> str:
+    return changelog_sections(changelog_file).get(version, "")
+
+
+def load_version_and_notes() -> tuple[str, str]:
+    """
+    Version and its changelog notes, reused from VERSION_CACHE while neither
+    Cargo.toml nor CHANGELOG.md has been modified since it was written.
     """
-    match = re.search(pattern, content, re.DOTALL | re.VERBOSE)
-    return match.group(1).strip() if match else ""
+    key = [os.stat("Cargo.toml").st_mtime_ns, os.stat("CHANGELOG.md").st_mtime_ns]
+    try:
+        cached = json.loads(VERSION_CACHE.read_text(encoding="utf-8"))
+        if cached["key"] == key:
+            return cached["version"], cached["notes"]
+    except (FileNotFoundError, ValueError, KeyError, TypeError):
+        pass
+
+    version = get_version()
+    notes = get_changelog_for_version(version)
+    VERSION_CACHE.write_text(
+        json.dumps({"key": key, "version": version, "notes": notes}), encoding="utf-8"
+    )
+    return version, notes
 
 
 def make_asset_url(name: str, version: str) -> str:
@@ -53,8 +112,7 @@ def make_asset_url(name: str, version: str) -> str:
     return f"https://github.com/{repo}/releases/download/{tag}/{name}"
 
 
-version = get_version()
-notes = get_changelog_for_version(version)
+version, notes = load_version_and_notes()
 
 root = {
     "version": version,